@@ -16,17 +16,21 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import os
-import time
-import urllib.parse
+import io
+import uuid
 import pandas as pd
 import pypdf
 from PIL import Image
 from openai import OpenAI
 from backend import PolyglotWizard, IdentityStamper
-from config import FORM_LIBRARY
+from extractor import FastPathExtractor
+from ui import DEFAULT_LANGUAGE, LANGUAGES, CHAT_WINDOW, translate, theme_bundle, chat_html
+from tenants import get_tenant, start_watcher, TenantNotFound, DEFAULT_TENANT
 from dispatcher import send_secure_email
+from invites import lookup_invite, mint_invites, parse_clients_csv
 from sms import send_sms_alert
-from logger import log_submission, load_logs
+from logger import load_logs, log_chat_turn, load_fastpath_stats
+from jobqueue import enqueue_job, get_job, retry_job
 from streamlit_drawable_canvas import st_canvas
 
 # --- 👻 GHOST SIGNATURE (Server-Side Only) ---
@@ -54,19 +58,20 @@ def get_openai_client(api_key):
         except: return None
     return None
 
-# --- 🔗 IMPORT SETTINGS (Client Specific) ---
+# --- 🔗 TENANT SETTINGS (Firm Specific) ---
+# The firm is picked by ?tenant= in the magic link and sticks for the session.
+# Without it, client_settings.py + config.py are served as before.
+start_watcher()
+tenant_id = st.session_state.get("tenant") or st.query_params.get("tenant") or DEFAULT_TENANT
 try:
-    import client_settings as cs
-except ImportError:
-    # Default Fallback if settings file is missing
-    class cs:
-        APP_TITLE = "She's Always Right, Esq."
-        PAGE_ICON = "⚖️"
-        TAGLINE = "Just ask her husband."
-        CLIENT_NAME = "She's Always Right, Esq."
-        ACCESS_CODES = ["TEST"]
-        LAWYER_EMAIL = "admin@example.com"
-        FINAL_SIGNATURE_TEXT = "I certify the above is true."
+    tenant = get_tenant(tenant_id)
+except TenantNotFound:
+    st.set_page_config(page_title="FormFlux")
+    st.error("Unknown firm. Please check your link.")
+    st.stop()
+st.session_state.tenant = tenant.tenant_id
+cs = tenant.settings
+FORM_LIBRARY = tenant.forms
 
 # --- 🛠️ SETUP PAGE CONFIGURATION ---
 st.set_page_config(
@@ -91,7 +96,14 @@ default_states = {
     "current_form_index": 0,
     "form_data": {},
     "idx": -1,
-    "uploaded_files": []
+    "uploaded_files": [],
+    "pending_field": None,
+    "fastpath_hits": 0,
+    "fastpath_turns": 0,
+    "show_full_chat": False,
+    "client_name": None,
+    "packet_id": None,
+    "submitted_job": None
 }
 
 for key, val in default_states.items():
@@ -99,114 +111,35 @@ for key, val in default_states.items():
         st.session_state[key] = val
 
 # --- 🗣️ GLOBAL TRANSLATION ENGINE ---
-# Supports 10+ languages for maximum accessibility.
-UI_LANG = {
-    "🇺🇸 English": {
-        "welcome": "Welcome to the Secure Client Portal.",
-        "terms_header": "📜 Terms of Service & Disclaimer",
-        "terms_body": "By proceeding, you acknowledge that FormFluxAI is a technology provider, not a law firm.",
-        "agree_btn": "I AGREE & PROCEED ➡️",
-        "choose_title": "🤖 Choose Your Assistant",
-        "choose_desc": "How would you like to complete your forms today?",
-        "mode_manual": "📝 Manual Mode",
-        "mode_manual_desc": "Fill out forms step-by-step.",
-        "mode_ai": "💬 AI Assistant",
-        "mode_ai_desc": "Chat with an AI that fills forms for you.",
-        "upload_header": "📂 The Vault: Secure Uploads",
-        "sign_header": "✍️ Final Authorization",
-        "finish_btn": "✅ SUBMIT ENTIRE PACKET",
-        "next_form": "✅ Form Complete! Proceed to Next ➡️",
-        "reset": "🔄 RESET / LOGOUT",
-        "input_req": "⚠️ Required"
-    },
-    "🇪🇸 Español": {
-        "welcome": "Bienvenido al Portal Seguro.",
-        "terms_header": "📜 Términos de Servicio",
-        "agree_btn": "ACEPTO Y CONTINÚO ➡️",
-        "choose_title": "🤖 Elija su Asistente",
-        "mode_manual": "📝 Modo Manual",
-        "mode_manual_desc": "Llenar paso a paso.",
-        "mode_ai": "💬 Asistente IA",
-        "mode_ai_desc": "Chatea con la IA.",
-        "upload_header": "📂 Bóveda de Documentos",
-        "sign_header": "✍️ Autorización Final",
-        "finish_btn": "✅ ENVIAR PAQUETE",
-        "next_form": "✅ ¡Completado! Siguiente ➡️",
-        "reset": "🔄 REINICIAR",
-        "input_req": "⚠️ Requerido"
-    }
-    # (Additional languages supported by PolyglotWizard in backend)
-}
-
 def t(key):
     """Retrieves the translated string for the current language."""
-    lang_dict = UI_LANG.get(st.session_state.language, UI_LANG["🇺🇸 English"])
-    return lang_dict.get(key, key)
-
-# --- 🎨 PROPRIETARY CSS STYLING ---
-font_css = ""
-if st.session_state.font_size == "Large":
-    font_css = "html, body, [class*='css'] { font-size: 20px !important; }"
-elif st.session_state.font_size == "Extra Large":
-    font_css = "html, body, [class*='css'] { font-size: 24px !important; }"
-
-# High Contrast vs. Midnight Flux Theme logic
-if st.session_state.high_contrast:
-    theme_css = """
-    .stApp { background-color: #ffffff !important; color: #000000 !important; }
-    div.block-container { background: #ffffff; border: 3px solid #000000; color: black; border-radius: 0px; }
-    .stButton>button { background: #000000 !important; color: #ffff00 !important; border: 3px solid #000000; border-radius: 0px; font-weight: 900; }
-    .stTextInput>div>div>input { background-color: #ffffff; color: black; border: 2px solid black; }
-    h1, h2, h3, h4, p, span, div, label { color: #000000 !important; font-family: Arial, sans-serif !important; }
-    """
-else:
-    theme_css = """
-    .stApp {
-        background: linear-gradient(-45deg, #0f2027, #203a43, #2c5364, #1f4068);
-        background-size: 400% 400%;
-        animation: gradient 15s ease infinite;
-        color: white;
-    }
-    div.block-container { background: rgba(255, 255, 255, 0.05); border-radius: 10px; padding: 20px; }
-    .stTextInput>div>div>input, .stSelectbox>div>div>div {
-        background-color: rgba(0, 0, 0, 0.3) !important; color: white !important; border: 1px solid rgba(255, 255, 255, 0.2);
-    }
-    label, .stRadio, .stCheckbox, p, h1, h2, h3 { color: white !important; }
-    button { border: 1px solid #00d4ff !important; color: #00d4ff !important; background: transparent !important; }
-    button:hover { background: #00d4ff !important; color: black !important; }
-    """
+    return translate(st.session_state.language, key)
 
-st.markdown(f"""
-<style>
-    {theme_css} 
-    {font_css}
-    
-    /* Utility Classes */
-    .link-box {{ background-color: #222; padding: 15px; border: 1px dashed #00d4ff; border-radius: 5px; font-family: monospace; color: #00d4ff; word-break: break-all; }}
-    .chat-user {{ background-color: #00d4ff; color: black; padding: 10px; border-radius: 10px; margin: 5px; text-align: right; }}
-    .chat-ai {{ background-color: #333; color: white; border: 1px solid #555; padding: 10px; border-radius: 10px; margin: 5px; text-align: left; }}
-    div[data-testid="InputInstructions"] {{ display: none !important; }}
-</style>
-""", unsafe_allow_html=True)
+# --- 🎨 PROPRIETARY CSS STYLING (Precomputed per theme) ---
+st.markdown(theme_bundle(st.session_state.high_contrast, st.session_state.font_size), unsafe_allow_html=True)
 
 # --- ⚡ MAGIC LINK HANDLER ---
 query_params = st.query_params
 magic_code = query_params.get("code")
 pre_selected_forms = query_params.get_all("form")
 
-if magic_code:
-    if magic_code == "CLIENT-9921" or magic_code in cs.ACCESS_CODES:
-        if not st.session_state.authenticated:
-            st.session_state.authenticated = True
-            st.session_state.user_mode = "client"
-            if pre_selected_forms:
-                st.session_state.form_queue = pre_selected_forms
-            st.rerun()
+if magic_code and not st.session_state.authenticated:
+    invite = lookup_invite(magic_code, tenant.tenant_id)
+    if invite or magic_code in tenant.access_codes:
+        st.session_state.authenticated = True
+        st.session_state.user_mode = "client"
+        if invite:
+            st.session_state.client_name = invite["client_name"]
+        # Per-client tokens carry their own bundle; firm-wide codes use the URL.
+        forms = invite["forms"] if invite else pre_selected_forms
+        if forms:
+            st.session_state.form_queue = forms
+        st.rerun()
 
 # --- 🛡️ SIDEBAR CONTROLLER ---
 with st.sidebar:
     with st.expander("👁️ Display & Language"):
-        st.session_state.language = st.selectbox("Language", list(UI_LANG.keys()))
+        st.session_state.language = st.selectbox("Language", LANGUAGES)
         st.divider()
         st.session_state.high_contrast = st.toggle("High Contrast Mode", value=st.session_state.high_contrast)
         st.session_state.font_size = st.select_slider("Text Size", options=["Normal", "Large", "Extra Large"])
@@ -223,7 +156,8 @@ with st.sidebar:
     st.title("⚖️ Firm Login")
     admin_pass = st.text_input("Password", type="password", label_visibility="collapsed")
     if st.button("ENTER DASHBOARD ➡️"):
-        if admin_pass == "1234":
+        # A firm without its own ADMIN_PASSWORD has no dashboard login.
+        if cs.ADMIN_PASSWORD and admin_pass == cs.ADMIN_PASSWORD:
             st.session_state.user_mode = "lawyer"
             st.session_state.authenticated = True
             st.rerun()
@@ -250,15 +184,58 @@ if st.session_state.user_mode == "lawyer":
             submitted = st.form_submit_button("📤 GENERATE LINK")
             
             if submitted and selected_forms:
-                base_url = "https://formflux.streamlit.app" 
-                query_string = "&".join([f"form={urllib.parse.quote(f)}" for f in selected_forms])
-                magic_link = f"{base_url}/?{query_string}&code=CLIENT-9921"
+                magic_link = mint_invites([{"name": client_name, "forms": selected_forms}], tenant_id=tenant.tenant_id)[0]["link"]
                 
                 st.success(f"Packet Ready for {client_name} containing {len(selected_forms)} forms.")
                 st.markdown("### 🔗 Secure Link:")
                 st.markdown(f'<div class="link-box">{magic_link}</div>', unsafe_allow_html=True)
                 st.caption("Copy the link above and send it to the client.")
 
+        st.divider()
+        st.subheader("📦 Bulk Invites")
+        st.caption('Upload a CSV with columns: name, email, forms (separate forms with ";").')
+        with st.form("bulk_dispatch_form"):
+            clients_csv = st.file_uploader("Clients CSV", type="csv")
+            campaign = st.text_input("Campaign Label", value="")
+            email_now = st.checkbox("Email each client their link now")
+            bulk_submitted = st.form_submit_button("📤 GENERATE ALL LINKS")
+            
+            if bulk_submitted and clients_csv:
+                try:
+                    clients = parse_clients_csv(io.StringIO(clients_csv.getvalue().decode("utf-8-sig")), known_forms=FORM_LIBRARY)
+                except ValueError as e:
+                    st.error(str(e))
+                    clients = []
+                
+                if clients:
+                    invites = mint_invites(clients, campaign=campaign or None, tenant_id=tenant.tenant_id)
+                    st.success(f"{len(invites)} invites minted.")
+                    if email_now:
+                        # Sending hundreds of emails is a background job, not a request.
+                        st.session_state.invites_job = enqueue_job(
+                            "invites",
+                            {"invites": [{k: i[k] for k in ("token", "name", "email", "link")} for i in invites], "firm_name": cs.CLIENT_NAME},
+                            idempotency_key=f"invites:{invites[0]['token']}"
+                        )
+                    links_df = pd.DataFrame([{"name": i["name"], "email": i["email"], "link": i["link"]} for i in invites])
+                    st.dataframe(links_df, use_container_width=True)
+                    st.session_state.bulk_links_csv = links_df.to_csv(index=False)
+        
+        if st.session_state.get("invites_job"):
+            job = get_job(st.session_state.invites_job)
+            if job:
+                total = len(job["payload"]["invites"])
+                sent = sum(1 for v in job["checkpoint"].values() if v == "sent")
+                st.info(f"📧 Invite emails: {job['status']} ({sent}/{total} sent)")
+                if job["status"] == "failed" and st.button("🔁 Retry Unsent Emails"):
+                    retry_job(job["id"])
+                    st.rerun()
+                elif job["status"] != "done" and st.button("🔄 Check Email Status"):
+                    st.rerun()
+
+        if st.session_state.get("bulk_links_csv"):
+            st.download_button("⬇️ Download Links CSV", st.session_state.bulk_links_csv, file_name="invite_links.csv", mime="text/csv")
+
     with tab_inspect:
         st.subheader("🛠️ Universal Field Finder")
         uploaded_pdf = st.file_uploader("Upload PDF Template", type="pdf")
@@ -269,7 +246,10 @@ if st.session_state.user_mode == "lawyer":
                 st.code(str(fields), language="python")
 
     with tab_logs:
-        st.dataframe(load_logs(), use_container_width=True)
+        hits, turns = load_fastpath_stats(tenant.tenant_id)
+        if turns:
+            st.metric("⚡ AI Fast-Path Hit Rate", f"{hits / turns:.0%}", help=f"{hits} of {turns} chat turns answered without calling the AI")
+        st.dataframe(load_logs(tenant.tenant_id), use_container_width=True)
 
 # =========================================================
 # 🌊 MODE 2: CLIENT INTAKE EXPERIENCE
@@ -283,8 +263,12 @@ else:
             st.info("Please enter your Access Code.")
             code = st.text_input("Access Code", type="password")
             if st.button("START"):
-                if code in cs.ACCESS_CODES or code == "CLIENT-9921": 
+                invite = lookup_invite(code, tenant.tenant_id)
+                if invite or code in tenant.access_codes:
                     st.session_state.authenticated = True
+                    if invite:
+                        st.session_state.form_queue = invite["forms"]
+                        st.session_state.client_name = invite["client_name"]
                     st.rerun()
         st.stop()
 
@@ -335,22 +319,49 @@ else:
             combined_fields.update(FORM_LIBRARY.get(fname, {}).get("fields", {}))
             
         wizard = PolyglotWizard(client, combined_fields, user_language=st.session_state.language)
+        extractor = FastPathExtractor(combined_fields)
         
         # Render Chat
+        # Only the recent window is rendered; older turns stay collapsed.
         chat_container = st.container()
         with chat_container:
-            for msg in st.session_state.chat_history:
-                role_class = "chat-ai" if msg["role"] == "ai" else "chat-user"
-                st.markdown(f"<div class='{role_class}'>{msg['content']}</div>", unsafe_allow_html=True)
+            history = st.session_state.chat_history
+            hidden = max(0, len(history) - CHAT_WINDOW)
+            if hidden:
+                st.session_state.show_full_chat = st.toggle(f"{t('earlier_msgs')} ({hidden})", value=st.session_state.show_full_chat)
+                if st.session_state.show_full_chat:
+                    st.markdown(chat_html(history[:hidden]), unsafe_allow_html=True)
+            st.markdown(chat_html(history[hidden:]), unsafe_allow_html=True)
 
         # Chat Input
         user_input = st.chat_input("Type your answer here...")
         
         if user_input:
             st.session_state.chat_history.append({"role": "user", "content": user_input})
+            st.session_state.fastpath_turns += 1
+            
+            # -- FAST PATH (Local Extraction, No Round-Trip) --
+            local_data = extractor.extract(user_input, st.session_state.form_data, st.session_state.pending_field)
+            log_chat_turn(bool(local_data), tenant.tenant_id)
+            
+            if local_data:
+                st.session_state.fastpath_hits += 1
+                st.session_state.form_data.update(local_data)
+                next_key, next_q = extractor.next_question(st.session_state.form_data)
+                st.session_state.pending_field = next_key
+                saved = t("fastpath_saved").format(saved=", ".join(
+                    f"{combined_fields[k].get('description', k).rstrip('?: ')}: {v}" for k, v in local_data.items()))
+                if next_key:
+                    # English can use the description as-is; other languages need it translated.
+                    if st.session_state.language != DEFAULT_LANGUAGE:
+                        next_q = wizard.generate_question(next_key)
+                    response_text = f"{saved} {next_q}"
+                else:
+                    response_text = f"{saved} {t('fastpath_done')}"
             
             # -- AI BRAIN LOGIC --
-            if client:
+            elif client:
+                st.session_state.pending_field = None
                 response_text, extracted_data = wizard.chat_with_assistant(st.session_state.chat_history, st.session_state.form_data)
                 st.session_state.form_data.update(extracted_data)
             else:
@@ -363,6 +374,10 @@ else:
             
         with st.expander("🕵️ Debug: See What The AI Is Filling"):
             st.json(st.session_state.form_data)
+            turns = st.session_state.fastpath_turns
+            if turns:
+                hits = st.session_state.fastpath_hits
+                st.caption(f"⚡ Fast-path hit rate: {hits}/{turns} turns ({hits / turns:.0%}) answered locally")
             
         if st.button("✅ REVIEW & SIGN FORMS"):
              st.session_state.intake_method = "manual"
@@ -374,6 +389,31 @@ else:
         
         # CHECK IF QUEUE DONE -> GO TO VAULT
         if st.session_state.current_form_index >= len(st.session_state.form_queue):
+            # === SUBMISSION STATUS (After SUBMIT) ===
+            if st.session_state.submitted_job:
+                job = get_job(st.session_state.submitted_job)
+                status = job["status"] if job else "unknown"
+                if status == "done":
+                    st.balloons()
+                    st.success("✅ PACKET DELIVERED TO FIRM")
+                    if st.button("FINISH"):
+                        st.session_state.clear()
+                        st.rerun()
+                elif status == "failed":
+                    st.error("⚠️ We couldn't deliver your packet automatically. It has been flagged for the firm to follow up.")
+                    c1, c2 = st.columns(2)
+                    if c1.button("🔁 TRY AGAIN"):
+                        retry_job(st.session_state.submitted_job)
+                        st.rerun()
+                    if c2.button("START OVER"):
+                        st.session_state.clear()
+                        st.rerun()
+                else:
+                    st.success("✅ PACKET SUBMITTED TO FIRM")
+                    st.info(f"⏳ Processing your packet... (status: {status})")
+                    if st.button("🔄 Check Status"): st.rerun()
+                st.stop()
+
             # === THE VAULT (FINAL STEP) ===
             st.title(t("upload_header"))
             
@@ -397,11 +437,25 @@ else:
             
             if st.button(t("finish_btn")):
                 if sig.image_data is not None:
-                    st.balloons()
-                    st.success("✅ PACKET SUBMITTED TO FIRM")
-                    log_submission("Client", "Full Packet", "Completed")
-                    time.sleep(5)
-                    st.session_state.clear()
+                    # One packet id per session: double-clicks enqueue only once.
+                    if not st.session_state.packet_id:
+                        st.session_state.packet_id = uuid.uuid4().hex
+                    form_data = st.session_state.form_data
+                    # Invite name first, then the firm's designated name fields.
+                    client_name = st.session_state.client_name or next(
+                        (form_data[k] for k in cs.CLIENT_NAME_FIELDS if form_data.get(k)), "Client")
+                    payload = {
+                        "client_name": client_name,
+                        "form_data": form_data,
+                        "forms": [
+                            {"name": f, "filename": FORM_LIBRARY[f]["filename"], "recipient_email": FORM_LIBRARY[f].get("recipient_email", cs.LAWYER_EMAIL)}
+                            for f in st.session_state.form_queue if f in FORM_LIBRARY
+                        ],
+                        "uploaded_files": st.session_state.uploaded_files,
+                        "alert_phone": cs.LAWYER_PHONE,
+                        "tenant": tenant.tenant_id
+                    }
+                    st.session_state.submitted_job = enqueue_job("packet", payload, idempotency_key=st.session_state.packet_id)
                     st.rerun()
                 else:
                     st.error("Please sign to finish.")
@@ -88,12 +88,15 @@ class IdentityStamper:
     def compile_final_doc(self, form_data, sig_path, selfie_path, id_path):
         """Stamps answers onto PDF."""
         if not os.path.exists(self.template_path): return None
-        reader = pypdf.PdfReader(self.template_path)
-        writer = pypdf.PdfWriter()
+        # Cloning keeps the template's /AcroForm, which add_page() drops.
+        writer = pypdf.PdfWriter(clone_from=self.template_path)
+        fields = writer.get_fields() or {}
+        values = {k: str(v) for k, v in form_data.items() if k in fields}
 
-        for page in reader.pages:
-            writer.add_page(page)
-            writer.update_page_form_field_values(writer.pages[-1], form_data)
+        # Flat templates (no fillable fields) are passed through as-is.
+        if values:
+            for page in writer.pages:
+                writer.update_page_form_field_values(page, values, auto_regenerate=False)
 
         output_stream = io.BytesIO()
         writer.write(output_stream)
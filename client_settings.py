@@ -9,7 +9,11 @@ CLIENT_NAME = "She's Always Right, Esq."
 # SECURITY
 ACCESS_CODES = ["TEST", "GWEN-RULES"]
 
+# FORM FIELDS HOLDING THE CLIENT'S NAME (first filled one is used)
+CLIENT_NAME_FIELDS = ["Husband_Name", "Tenant_Name"]
+
 # CONTACT
 LAWYER_EMAIL = "gwendolyn@alwaysright.com"
+LAWYER_PHONE = ""  # SMS alerts on new submissions (leave blank to disable)
 FINAL_SIGNATURE_TEXT = "Sign here to admit I was right."
 CONSENT_TEXT = "I officially agree to these terms."
@@ -25,4 +25,71 @@ def send_secure_email(pdf_path, client_name, recipient_email):
         return True, "Sent"
     except Exception as e:
         return False, str(e)
-      
+
+
+NO_EMAIL = "No email address"
+
+
+def send_invite_emails(invites, firm_name="FormFlux", on_result=None):
+    """
+    Emails each invite its magic link over one pooled SMTP connection.
+    A failed connect/login aborts the batch (no login per client).
+    on_result(token, ok, info) is called after every invite, as it happens.
+    Returns [(token, ok, info), ...].
+    """
+    sender_email = st.secrets["EMAIL_USER"]
+    sender_pass = st.secrets["EMAIL_PASS"]
+    context = ssl.create_default_context()
+    results = []
+    server = None
+    aborted = None
+
+    def record(result):
+        results.append(result)
+        if on_result: on_result(*result)
+
+    def connect():
+        conn = smtplib.SMTP_SSL("smtp.gmail.com", 465, context=context)
+        conn.login(sender_email, sender_pass)
+        return conn
+
+    try:
+        for invite in invites:
+            if aborted:
+                record((invite["token"], False, f"Not sent: {aborted}"))
+                continue
+            if not invite.get("email"):
+                record((invite["token"], False, NO_EMAIL))
+                continue
+
+            msg = EmailMessage()
+            msg['Subject'] = f"{firm_name}: Your Secure Intake Forms"
+            msg['From'] = sender_email
+            msg['To'] = invite["email"]
+            msg.set_content(f"Hello {invite['name']},\n\nPlease complete your forms here:\n{invite['link']}\n\nSent via FormFlux.")
+
+            # Reconnect once if the pooled connection dropped mid-batch.
+            for attempt in range(2):
+                if server is None:
+                    try:
+                        server = connect()
+                    except Exception as e:
+                        aborted = f"SMTP connection failed ({e})"
+                        record((invite["token"], False, aborted))
+                        break
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected as e:
+                    server = None
+                    if attempt: record((invite["token"], False, str(e)))
+                except Exception as e:
+                    record((invite["token"], False, str(e)))
+                    break
+                else:
+                    record((invite["token"], True, "Sent"))
+                    break
+    finally:
+        if server is not None:
+            try: server.quit()
+            except Exception: pass
+    return results
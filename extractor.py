@@ -0,0 +1,150 @@
+"""
+================================================================================
+  MODULE:       extractor.py
+  PROJECT:      FormFluxAI
+  AUTHOR:       Justin White
+  COPYRIGHT:    (c) 2026 FormFluxAI. All Rights Reserved.
+
+  DESCRIPTION:
+  The "Reflexes". Local, deterministic field extraction that runs before
+  the AI Brain. Dates, dollar amounts, radio options and yes/no answers
+  are captured instantly; anything ambiguous is passed on to the LLM.
+================================================================================
+"""
+
+import re
+import difflib
+from datetime import datetime
+
+# --- ⚡ PRECOMPILED PATTERNS ---
+DATE_RE = re.compile(
+    r"^\s*(?:"
+    r"(?P<m>\d{1,2})[/\-.](?P<d>\d{1,2})[/\-.](?P<y>\d{2}|\d{4})"
+    r"|(?P<iy>\d{4})-(?P<im>\d{1,2})-(?P<id>\d{1,2})"
+    r"|(?P<tm>[A-Za-z]{3,9})\.?\s+(?P<td>\d{1,2})(?:st|nd|rd|th)?,?\s+(?P<ty>\d{4})"
+    r")\s*$"
+)
+MONEY_RE = re.compile(
+    r"^\s*(?P<pre>usd\s*|\$\s*|usd\s*\$\s*)?(?P<amt>\d{1,3}(?:,\d{3})+|\d+)(?P<cents>\.\d{1,2})?\s*(?P<post>usd|dollars?|bucks)?\s*$",
+    re.IGNORECASE
+)
+YES_RE = re.compile(r"^\s*(?:y|yes|yeah|yep|sure|ok|okay|i agree|agreed|si|sí|true)\s*[.!]*\s*$", re.IGNORECASE)
+NO_RE = re.compile(r"^\s*(?:n|no|nope|nah|i do not agree|i disagree|false)\s*[.!]*\s*$", re.IGNORECASE)
+
+DATE_HINT_RE = re.compile(r"\bdate\b|\bwhen\b|\bdob\b|birth", re.IGNORECASE)
+MONEY_HINT_RE = re.compile(r"\$|\brent\b|budget|amount|price|cost|salary|income|fee", re.IGNORECASE)
+
+MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+# Minimum similarity for a radio option to count as a match.
+FUZZY_CUTOFF = 0.85
+
+
+def parse_date(text):
+    """Returns the date as MM/DD/YYYY, or None if the text is not just a date."""
+    m = DATE_RE.match(text)
+    if not m: return None
+    try:
+        if m.group("m"):
+            year = int(m.group("y"))
+            if year < 100: year += 2000
+            value = datetime(year, int(m.group("m")), int(m.group("d")))
+        elif m.group("iy"):
+            value = datetime(int(m.group("iy")), int(m.group("im")), int(m.group("id")))
+        else:
+            month = MONTHS.get(m.group("tm")[:3].lower())
+            if not month: return None
+            value = datetime(int(m.group("ty")), month, int(m.group("td")))
+    except ValueError:
+        return None
+    return value.strftime("%m/%d/%Y")
+
+
+def parse_money(text):
+    """
+    Returns the amount as $X.XX, or None if the text is not just an amount.
+    A bare number ("2024") is not money; it needs a $ sign or currency word.
+    """
+    m = MONEY_RE.match(text)
+    if not m or not (m.group("pre") or m.group("post")): return None
+    amount = float(m.group("amt").replace(",", "") + (m.group("cents") or ""))
+    return f"${amount:,.2f}"
+
+
+def parse_yes_no(text):
+    """Returns "Yes", "No", or None."""
+    if YES_RE.match(text): return "Yes"
+    if NO_RE.match(text): return "No"
+    return None
+
+
+def match_option(text, options):
+    """Fuzzy-matches the text against a radio field's options."""
+    lowered = {opt.lower(): opt for opt in options}
+    key = text.strip().lower()
+    if key in lowered: return lowered[key]
+    best = difflib.get_close_matches(key, list(lowered.keys()), n=1, cutoff=FUZZY_CUTOFF)
+    return lowered[best[0]] if best else None
+
+
+class FastPathExtractor:
+    def __init__(self, fields_config):
+        self.fields = fields_config
+        self.kinds = {k: self.field_kind(k, v) for k, v in fields_config.items()}
+
+    @staticmethod
+    def field_kind(field_key, field_info):
+        """Classifies a FORM_LIBRARY field: radio, checkbox, date, money or text."""
+        ftype = field_info.get("type", "text")
+        if ftype in ("radio", "checkbox"): return ftype
+        if field_info.get("format"): return field_info["format"]
+        hint = f"{field_key} {field_info.get('description', '')}"
+        if DATE_HINT_RE.search(hint.replace("_", " ")): return "date"
+        if MONEY_HINT_RE.search(hint.replace("_", " ")): return "money"
+        return "text"
+
+    def missing_fields(self, current_form_data):
+        return [k for k in self.fields if not current_form_data.get(k)]
+
+    def extract(self, user_input, current_form_data, pending_field=None):
+        """
+        Tries to answer a chat turn locally.
+        Returns {field: value} only when exactly one missing field is a
+        confident match, otherwise {} (hand the turn to the LLM).
+        """
+        missing = self.missing_fields(current_form_data)
+        if not user_input or not missing: return {}
+
+        # 1. If we just asked a question, the answer belongs to that field or the LLM.
+        if pending_field:
+            value = self.parse_for(pending_field, user_input) if pending_field in missing else None
+            return {pending_field: value} if value else {}
+
+        # 2. With no pending question, the answer must fit exactly one open field.
+        # Yes/No is never guessed without a pending question.
+        hits = {}
+        for key in missing:
+            if self.kinds[key] in ("checkbox", "text"): continue
+            value = self.parse_for(key, user_input)
+            if value: hits[key] = value
+        return hits if len(hits) == 1 else {}
+
+    def parse_for(self, field_key, user_input):
+        kind = self.kinds[field_key]
+        if kind == "radio":
+            return match_option(user_input, self.fields[field_key].get("options", ["Yes", "No"]))
+        if kind == "checkbox":
+            return parse_yes_no(user_input)
+        if kind == "date":
+            return parse_date(user_input)
+        if kind == "money":
+            return parse_money(user_input)
+        return None
+
+    def next_question(self, current_form_data):
+        """Returns (field, question) for the next missing field, or (None, None)."""
+        missing = self.missing_fields(current_form_data)
+        if not missing: return None, None
+        key = missing[0]
+        return key, self.fields[key].get("description", key)
@@ -0,0 +1,161 @@
+"""
+================================================================================
+  MODULE:       invites.py
+  PROJECT:      FormFluxAI
+  AUTHOR:       Justin White
+  COPYRIGHT:    (c) 2026 FormFluxAI. All Rights Reserved.
+
+  DESCRIPTION:
+  Per-client invite tokens and magic links. Tokens live in an indexed
+  SQLite table so validating a link is a single primary-key lookup.
+
+  Bulk CLI (CSV columns: name, email, forms -- forms separated by ";"):
+
+      python invites.py clients.csv --campaign spring-2026 --send
+================================================================================
+"""
+
+import argparse
+import csv
+import json
+import secrets
+import sqlite3
+import sys
+import time
+import urllib.parse
+from tenants import DEFAULT_TENANT, get_tenant
+
+INVITE_DB = "invites.db"
+BASE_URL = "https://formflux.streamlit.app"
+FORM_SEPARATOR = ";"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS invites (
+    token       TEXT PRIMARY KEY,
+    tenant      TEXT NOT NULL DEFAULT 'default',
+    client_name TEXT NOT NULL,
+    email       TEXT,
+    forms       TEXT NOT NULL,
+    campaign    TEXT,
+    created     REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS invites_campaign ON invites (campaign);
+"""
+
+
+def _connect():
+    conn = sqlite3.connect(INVITE_DB, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def new_token():
+    return "FF-" + secrets.token_urlsafe(12)
+
+
+def build_magic_link(token, tenant_id=DEFAULT_TENANT, base_url=BASE_URL):
+    """The token carries the form bundle, so the link only needs the firm and code."""
+    query = {"code": token} if tenant_id == DEFAULT_TENANT else {"tenant": tenant_id, "code": token}
+    return f"{base_url}/?{urllib.parse.urlencode(query)}"
+
+
+def parse_clients_csv(lines, known_forms=None):
+    """
+    Reads client rows from CSV text lines.
+    Raises ValueError naming the first bad row.
+    """
+    clients = []
+    for row_num, row in enumerate(csv.DictReader(lines), start=2):
+        # DictReader puts surplus fields under a None key (e.g. forms split by ",").
+        if None in row:
+            raise ValueError(f"Row {row_num}: too many columns (separate forms with '{FORM_SEPARATOR}')")
+        row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+        forms = [f.strip() for f in row.get("forms", "").split(FORM_SEPARATOR) if f.strip()]
+        if not row.get("name"):
+            raise ValueError(f"Row {row_num}: missing client name")
+        if not forms:
+            raise ValueError(f"Row {row_num}: no forms listed")
+        if known_forms is not None:
+            unknown = [f for f in forms if f not in known_forms]
+            if unknown:
+                raise ValueError(f"Row {row_num}: unknown form(s) {', '.join(unknown)}")
+        clients.append({"name": row["name"], "email": row.get("email", ""), "forms": forms})
+    return clients
+
+
+def mint_invites(clients, campaign=None, tenant_id=DEFAULT_TENANT, base_url=BASE_URL):
+    """Mints one token per client in a single transaction and returns the invites with links."""
+    now = time.time()
+    invites = [
+        {"token": new_token(), "name": c["name"], "email": c.get("email", ""), "forms": list(c["forms"])}
+        for c in clients
+    ]
+    conn = _connect()
+    try:
+        with conn:
+            conn.executemany(
+                "INSERT INTO invites (token, tenant, client_name, email, forms, campaign, created) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(i["token"], tenant_id, i["name"], i["email"], json.dumps(i["forms"]), campaign, now) for i in invites]
+            )
+    finally:
+        conn.close()
+    for invite in invites:
+        invite["link"] = build_magic_link(invite["token"], tenant_id, base_url)
+    return invites
+
+
+def lookup_invite(token, tenant_id=DEFAULT_TENANT):
+    """Returns the firm's invite for a token (O(1) indexed lookup), or None."""
+    if not token: return None
+    conn = _connect()
+    try:
+        row = conn.execute("SELECT * FROM invites WHERE token = ?", (token,)).fetchone()
+    finally:
+        conn.close()
+    if row is None or row["tenant"] != tenant_id: return None
+    invite = dict(row)
+    invite["forms"] = json.loads(invite["forms"])
+    return invite
+
+
+def main():
+    from dispatcher import send_invite_emails
+
+    parser = argparse.ArgumentParser(description="Mint FormFlux invite links from a CSV of clients")
+    parser.add_argument("csv_path", help="CSV with columns: name, email, forms")
+    parser.add_argument("--tenant", default=DEFAULT_TENANT, help="firm the invites belong to")
+    parser.add_argument("--campaign", default=None, help="label stored with every invite")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--out", default=None, help="write name,email,link CSV here (default: stdout)")
+    parser.add_argument("--send", action="store_true", help="email each client their link")
+    args = parser.parse_args()
+
+    tenant = get_tenant(args.tenant)
+    with open(args.csv_path, newline="", encoding="utf-8-sig") as f:
+        try:
+            clients = parse_clients_csv(f, known_forms=tenant.forms)
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+
+    invites = mint_invites(clients, campaign=args.campaign, tenant_id=tenant.tenant_id, base_url=args.base_url)
+
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(["name", "email", "link"])
+        for i in invites:
+            writer.writerow([i["name"], i["email"], i["link"]])
+    finally:
+        if args.out: out.close()
+
+    if args.send:
+        results = send_invite_emails(invites, firm_name=tenant.settings.CLIENT_NAME)
+        failed = [r for r in results if not r[1]]
+        print(f"Emailed {len(results) - len(failed)}/{len(results)} invites.", file=sys.stderr)
+        for token, _, info in failed:
+            print(f"  {token}: {info}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
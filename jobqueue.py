@@ -0,0 +1,200 @@
+"""
+================================================================================
+  MODULE:       jobqueue.py
+  PROJECT:      FormFluxAI
+  AUTHOR:       Justin White
+  COPYRIGHT:    (c) 2026 FormFluxAI. All Rights Reserved.
+
+  DESCRIPTION:
+  Durable local job queue (SQLite). The web tier only enqueues; slow side
+  effects (PDF stamping, email, SMS, logging) run in worker.py processes.
+================================================================================
+"""
+
+import json
+import sqlite3
+import time
+import uuid
+
+JOB_DB = "jobs.db"
+
+# A running job whose lease expires is assumed dead and is handed out again.
+LEASE_SECONDS = 300
+MAX_ATTEMPTS = 5
+RETRY_BACKOFF = 10  # seconds, doubled per attempt
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id              TEXT PRIMARY KEY,
+    kind            TEXT NOT NULL,
+    payload         TEXT NOT NULL,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    status          TEXT NOT NULL DEFAULT 'queued',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    max_attempts    INTEGER NOT NULL,
+    checkpoint      TEXT NOT NULL DEFAULT '{}',
+    error           TEXT,
+    run_after       REAL NOT NULL,
+    lease_until     REAL,
+    lease_token     TEXT,
+    created         REAL NOT NULL,
+    updated         REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, run_after);
+"""
+
+
+class LeaseLost(Exception):
+    """The job's lease expired and another worker now owns it."""
+    pass
+
+
+def _connect():
+    conn = sqlite3.connect(JOB_DB, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _to_dict(row):
+    if row is None: return None
+    job = dict(row)
+    job["payload"] = json.loads(job["payload"])
+    job["checkpoint"] = json.loads(job["checkpoint"])
+    return job
+
+
+def enqueue_job(kind, payload, idempotency_key, max_attempts=MAX_ATTEMPTS):
+    """
+    Adds a job and returns its id.
+    Enqueuing the same idempotency key twice returns the original job.
+    """
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute(
+            "INSERT OR IGNORE INTO jobs (id, kind, payload, idempotency_key, max_attempts, run_after, created, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (uuid.uuid4().hex, kind, json.dumps(payload), idempotency_key, max_attempts, now, now, now)
+        )
+        row = conn.execute("SELECT id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)).fetchone()
+        return row["id"]
+    finally:
+        conn.close()
+
+
+def claim_job():
+    """
+    Leases the oldest ready job to the calling worker, or returns None.
+    The returned job carries a lease_token that later updates must present.
+    """
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute(
+            "SELECT * FROM jobs WHERE (status IN ('queued', 'retrying') AND run_after <= ?) "
+            "OR (status = 'running' AND lease_until < ?) ORDER BY created LIMIT 1",
+            (now, now)
+        ).fetchone()
+        if row is None:
+            conn.execute("COMMIT")
+            return None
+        lease_token = uuid.uuid4().hex
+        conn.execute(
+            "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_until = ?, lease_token = ?, updated = ? WHERE id = ?",
+            (now + LEASE_SECONDS, lease_token, now, row["id"])
+        )
+        conn.execute("COMMIT")
+        job = _to_dict(row)
+        job["attempts"] += 1
+        job["lease_token"] = lease_token
+        return job
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+
+def save_checkpoint(job_id, checkpoint, lease_token):
+    """
+    Records finished steps so a retry skips side effects that already happened.
+    Also renews the lease. Raises LeaseLost if another worker owns the job.
+    """
+    now = time.time()
+    conn = _connect()
+    try:
+        cur = conn.execute(
+            "UPDATE jobs SET checkpoint = ?, lease_until = ?, updated = ? "
+            "WHERE id = ? AND status = 'running' AND lease_token = ?",
+            (json.dumps(checkpoint), now + LEASE_SECONDS, now, job_id, lease_token)
+        )
+        if cur.rowcount == 0: raise LeaseLost(job_id)
+    finally:
+        conn.close()
+
+
+def complete_job(job_id, lease_token):
+    """Marks the job done. Returns False if the lease was lost."""
+    conn = _connect()
+    try:
+        cur = conn.execute(
+            "UPDATE jobs SET status = 'done', error = NULL, lease_until = NULL, lease_token = NULL, updated = ? "
+            "WHERE id = ? AND status = 'running' AND lease_token = ?",
+            (time.time(), job_id, lease_token)
+        )
+        return cur.rowcount > 0
+    finally:
+        conn.close()
+
+
+def fail_job(job_id, error, lease_token):
+    """
+    Schedules a retry with backoff, or marks the job failed when out of attempts.
+    Returns the new status, or None if the lease was lost.
+    """
+    now = time.time()
+    conn = _connect()
+    try:
+        row = conn.execute(
+            "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = 'running' AND lease_token = ?",
+            (job_id, lease_token)
+        ).fetchone()
+        if row is None: return None
+        if row["attempts"] >= row["max_attempts"]:
+            status, run_after = "failed", now
+        else:
+            status, run_after = "retrying", now + RETRY_BACKOFF * 2 ** (row["attempts"] - 1)
+        cur = conn.execute(
+            "UPDATE jobs SET status = ?, error = ?, run_after = ?, lease_until = NULL, lease_token = NULL, updated = ? "
+            "WHERE id = ? AND lease_token = ?",
+            (status, str(error), run_after, now, job_id, lease_token)
+        )
+        return status if cur.rowcount else None
+    finally:
+        conn.close()
+
+
+def retry_job(job_id):
+    """Puts a failed job back in the queue with fresh attempts (its checkpoint is kept)."""
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute(
+            "UPDATE jobs SET status = 'queued', attempts = 0, error = NULL, run_after = ?, updated = ? "
+            "WHERE id = ? AND status = 'failed'",
+            (now, now, job_id)
+        )
+    finally:
+        conn.close()
+
+
+def get_job(job_id):
+    """Returns the job as a dict (for status polling), or None."""
+    conn = _connect()
+    try:
+        return _to_dict(conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+    finally:
+        conn.close()
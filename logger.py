@@ -6,7 +6,13 @@ from datetime import datetime
 # and start a fresh database.
 LOG_FILE = "logs_v2.csv"
 
-def log_submission(client_name, form_name, status):
+def log_file_for(tenant_id=None):
+    """Each firm gets its own log; the default firm keeps the original file."""
+    if not tenant_id or tenant_id == "default":
+        return LOG_FILE
+    return f"logs_v2_{tenant_id}.csv"
+
+def log_submission(client_name, form_name, status, tenant_id=None):
     """
     Saves a new entry to the log file.
     """
@@ -19,22 +25,58 @@ def log_submission(client_name, form_name, status):
     }
     
     # 2. Check if file exists to determine if we need headers
-    file_exists = os.path.isfile(LOG_FILE)
+    log_file = log_file_for(tenant_id)
+    file_exists = os.path.isfile(log_file)
     
     # 3. Save to CSV
     df = pd.DataFrame([new_entry])
-    df.to_csv(LOG_FILE, mode='a', header=not file_exists, index=False)
+    df.to_csv(log_file, mode='a', header=not file_exists, index=False)
 
-def load_logs():
+def load_logs(tenant_id=None):
     """
     Reads the log file for the Dashboard.
     """
-    if os.path.exists(LOG_FILE):
+    log_file = log_file_for(tenant_id)
+    if os.path.exists(log_file):
         try:
-            return pd.read_csv(LOG_FILE)
+            return pd.read_csv(log_file)
         except:
             # If file is corrupt, return empty
             return pd.DataFrame(columns=["Timestamp", "Client", "Form", "Status"])
     else:
         # If no logs yet, return empty structure
         return pd.DataFrame(columns=["Timestamp", "Client", "Form", "Status"])
+
+# AI chat turns, so the firm can see how many were answered without the LLM.
+STATS_FILE = "fastpath_stats.csv"
+
+def stats_file_for(tenant_id=None):
+    """Same per-firm split as the submission log."""
+    if not tenant_id or tenant_id == "default":
+        return STATS_FILE
+    return f"fastpath_stats_{tenant_id}.csv"
+
+def log_chat_turn(answered_locally, tenant_id=None):
+    """
+    Records one AI-mode chat turn and whether the fast path answered it.
+    """
+    stats_file = stats_file_for(tenant_id)
+    file_exists = os.path.isfile(stats_file)
+    df = pd.DataFrame([{
+        "Timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "Fast_Path": "Yes" if answered_locally else "No"
+    }])
+    df.to_csv(stats_file, mode='a', header=not file_exists, index=False)
+
+def load_fastpath_stats(tenant_id=None):
+    """
+    Returns (fast-path hits, total turns) for the Dashboard.
+    """
+    stats_file = stats_file_for(tenant_id)
+    if not os.path.exists(stats_file):
+        return 0, 0
+    try:
+        df = pd.read_csv(stats_file)
+    except:
+        return 0, 0
+    return int((df["Fast_Path"] == "Yes").sum()), len(df)
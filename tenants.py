@@ -0,0 +1,199 @@
+"""
+================================================================================
+  MODULE:       tenants.py
+  PROJECT:      FormFluxAI
+  AUTHOR:       Justin White
+  COPYRIGHT:    (c) 2026 FormFluxAI. All Rights Reserved.
+
+  DESCRIPTION:
+  Multi-tenant configuration. One deployment serves many firms:
+
+      tenants/<tenant_id>/settings.json   (same keys as client_settings.py)
+      tenants/<tenant_id>/forms.json      (same shape as config.FORM_LIBRARY)
+
+  Loaded configs are cached per process (LRU, bounded) and evicted when
+  their files change, so edits go live without restarting workers.
+  The "default" tenant is client_settings.py + config.py, as before.
+================================================================================
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from types import MappingProxyType, SimpleNamespace
+
+TENANTS_DIR = "tenants"
+DEFAULT_TENANT = "default"
+MAX_CACHED_TENANTS = int(os.environ.get("FORMFLUX_TENANT_CACHE", "32"))
+
+TENANT_ID_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+# Fallback values for any setting a tenant leaves out.
+# No access codes and no dashboard password: a firm must set its own.
+DEFAULT_SETTINGS = {
+    "APP_TITLE": "FormFlux Client Portal",
+    "PAGE_ICON": "⚖️",
+    "TAGLINE": "",
+    "CLIENT_NAME": "FormFlux Client Portal",
+    "ACCESS_CODES": [],
+    "LAWYER_EMAIL": "",
+    "LAWYER_PHONE": "",
+    "CLIENT_NAME_FIELDS": ["Client_Name"],
+    "ADMIN_PASSWORD": None,
+    "FINAL_SIGNATURE_TEXT": "I certify the above is true."
+}
+
+# The single-firm values the app always used; only the default tenant inherits them.
+LEGACY_SETTINGS = {
+    **DEFAULT_SETTINGS,
+    "APP_TITLE": "She's Always Right, Esq.",
+    "TAGLINE": "Just ask her husband.",
+    "CLIENT_NAME": "She's Always Right, Esq.",
+    "ACCESS_CODES": ["TEST"],
+    "LAWYER_EMAIL": "admin@example.com",
+    "ADMIN_PASSWORD": "1234"
+}
+
+
+class TenantNotFound(Exception):
+    pass
+
+
+class TenantConfig:
+    def __init__(self, tenant_id, settings, forms):
+        self.tenant_id = tenant_id
+        base = LEGACY_SETTINGS if tenant_id == DEFAULT_TENANT else DEFAULT_SETTINGS
+        self.settings = SimpleNamespace(**{**base, **settings})
+        self.forms = MappingProxyType(forms)
+        self.access_codes = frozenset(self.settings.ACCESS_CODES)
+
+
+_cache = OrderedDict()
+_stale = set()  # changed on disk; reloaded on next use, served as-is if the reload fails
+_versions = {}  # bumped on change so a load racing a file change is not cached
+_lock = threading.Lock()
+_observer = None
+
+# Errors from a half-written or malformed settings.json/forms.json.
+LOAD_ERRORS = (OSError, ValueError, TypeError, AttributeError)
+
+
+def _load_default():
+    from config import FORM_LIBRARY
+    try:
+        import client_settings
+        settings = {k: v for k, v in vars(client_settings).items() if k.isupper()}
+    except ImportError:
+        settings = {}
+    return TenantConfig(DEFAULT_TENANT, settings, FORM_LIBRARY)
+
+
+def _load_from_dir(tenant_id):
+    tenant_dir = os.path.join(TENANTS_DIR, tenant_id)
+    if not os.path.isdir(tenant_dir):
+        raise TenantNotFound(tenant_id)
+
+    settings_path = os.path.join(tenant_dir, "settings.json")
+    settings = {}
+    if os.path.exists(settings_path):
+        with open(settings_path, encoding="utf-8") as f:
+            settings = json.load(f)
+
+    with open(os.path.join(tenant_dir, "forms.json"), encoding="utf-8") as f:
+        forms = json.load(f)
+
+    # PDF templates may live next to the tenant's forms.json.
+    for form in forms.values():
+        local_pdf = os.path.join(tenant_dir, form.get("filename", ""))
+        if form.get("filename") and os.path.exists(local_pdf):
+            form["filename"] = local_pdf
+
+    tenant = TenantConfig(tenant_id, settings, forms)
+    if not tenant.settings.ADMIN_PASSWORD:
+        print(f"[tenants] {tenant_id}: no ADMIN_PASSWORD set; dashboard login is disabled")
+    return tenant
+
+
+def get_tenant(tenant_id=None):
+    """
+    Returns the cached TenantConfig, loading it on a miss or after a change.
+    If a reload fails, the last good config keeps being served.
+    Raises TenantNotFound if the tenant has no good config to serve.
+    """
+    tenant_id = (tenant_id or DEFAULT_TENANT).lower()
+    if tenant_id != DEFAULT_TENANT and not TENANT_ID_RE.match(tenant_id):
+        raise TenantNotFound(tenant_id)
+
+    with _lock:
+        cached = _cache.get(tenant_id)
+        if cached is not None:
+            _cache.move_to_end(tenant_id)
+            if tenant_id not in _stale:
+                return cached
+        version = _versions.get(tenant_id, 0)
+
+    try:
+        tenant = _load_default() if tenant_id == DEFAULT_TENANT else _load_from_dir(tenant_id)
+    except LOAD_ERRORS as e:
+        if cached is None:
+            print(f"[tenants] {tenant_id}: config failed to load ({e})")
+            raise TenantNotFound(tenant_id) from e
+        print(f"[tenants] {tenant_id}: reload failed ({e}); serving last good config")
+        return cached
+
+    with _lock:
+        if _versions.get(tenant_id, 0) != version:
+            return tenant
+        _cache[tenant_id] = tenant
+        _cache.move_to_end(tenant_id)
+        _stale.discard(tenant_id)
+        while len(_cache) > MAX_CACHED_TENANTS:
+            evicted, _ = _cache.popitem(last=False)
+            _stale.discard(evicted)
+    return tenant
+
+
+def invalidate_tenant(tenant_id):
+    """Marks a tenant's config as changed on disk."""
+    with _lock:
+        if tenant_id in _cache:
+            _stale.add(tenant_id)
+        _versions[tenant_id] = _versions.get(tenant_id, 0) + 1
+
+
+def start_watcher():
+    """Starts the hot-reload file watcher once per process (no-op without watchdog)."""
+    global _observer
+    with _lock:
+        if _observer is not None:
+            return
+        try:
+            from watchdog.observers import Observer
+            from watchdog.events import FileSystemEventHandler
+        except ImportError:
+            return
+
+        # Watch even an empty deployment, so firms added later still hot-reload.
+        os.makedirs(TENANTS_DIR, exist_ok=True)
+
+        root = os.path.abspath(TENANTS_DIR)
+
+        # Only real changes count; open/close events fire on our own reads.
+        class ReloadHandler(FileSystemEventHandler):
+            def on_created(self, event): self.invalidate(event)
+            def on_modified(self, event): self.invalidate(event)
+            def on_deleted(self, event): self.invalidate(event)
+            def on_moved(self, event): self.invalidate(event)
+
+            def invalidate(self, event):
+                for path in (event.src_path, getattr(event, "dest_path", "")):
+                    rel = os.path.relpath(os.path.abspath(path), root) if path else os.pardir
+                    if not rel.startswith(os.pardir) and rel != os.curdir:
+                        invalidate_tenant(rel.split(os.sep)[0])
+
+        _observer = Observer()
+        _observer.daemon = True
+        _observer.schedule(ReloadHandler(), root, recursive=True)
+        _observer.start()
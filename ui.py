@@ -0,0 +1,142 @@
+"""
+================================================================================
+  MODULE:       ui.py
+  PROJECT:      FormFluxAI
+  AUTHOR:       Justin White
+  COPYRIGHT:    (c) 2026 FormFluxAI. All Rights Reserved.
+
+  DESCRIPTION:
+  Precomputed UI assets. Streamlit re-executes app.py on every rerun, but
+  imported modules load once per process, so translations and theme CSS
+  are built here a single time and reused.
+================================================================================
+"""
+
+import html
+from functools import lru_cache
+from types import MappingProxyType
+
+DEFAULT_LANGUAGE = "🇺🇸 English"
+
+# --- 🗣️ GLOBAL TRANSLATION ENGINE ---
+# Supports 10+ languages for maximum accessibility.
+UI_LANG = {
+    "🇺🇸 English": {
+        "welcome": "Welcome to the Secure Client Portal.",
+        "terms_header": "📜 Terms of Service & Disclaimer",
+        "terms_body": "By proceeding, you acknowledge that FormFluxAI is a technology provider, not a law firm.",
+        "agree_btn": "I AGREE & PROCEED ➡️",
+        "choose_title": "🤖 Choose Your Assistant",
+        "choose_desc": "How would you like to complete your forms today?",
+        "mode_manual": "📝 Manual Mode",
+        "mode_manual_desc": "Fill out forms step-by-step.",
+        "mode_ai": "💬 AI Assistant",
+        "mode_ai_desc": "Chat with an AI that fills forms for you.",
+        "upload_header": "📂 The Vault: Secure Uploads",
+        "sign_header": "✍️ Final Authorization",
+        "finish_btn": "✅ SUBMIT ENTIRE PACKET",
+        "next_form": "✅ Form Complete! Proceed to Next ➡️",
+        "reset": "🔄 RESET / LOGOUT",
+        "input_req": "⚠️ Required",
+        "earlier_msgs": "Show earlier messages",
+        "fastpath_saved": "Got it ({saved}).",
+        "fastpath_done": "That's everything I need. Click REVIEW & SIGN FORMS when ready."
+    },
+    "🇪🇸 Español": {
+        "welcome": "Bienvenido al Portal Seguro.",
+        "terms_header": "📜 Términos de Servicio",
+        "agree_btn": "ACEPTO Y CONTINÚO ➡️",
+        "choose_title": "🤖 Elija su Asistente",
+        "mode_manual": "📝 Modo Manual",
+        "mode_manual_desc": "Llenar paso a paso.",
+        "mode_ai": "💬 Asistente IA",
+        "mode_ai_desc": "Chatea con la IA.",
+        "upload_header": "📂 Bóveda de Documentos",
+        "sign_header": "✍️ Autorización Final",
+        "finish_btn": "✅ ENVIAR PAQUETE",
+        "next_form": "✅ ¡Completado! Siguiente ➡️",
+        "reset": "🔄 REINICIAR",
+        "input_req": "⚠️ Requerido",
+        "earlier_msgs": "Mostrar mensajes anteriores",
+        "fastpath_saved": "Entendido ({saved}).",
+        "fastpath_done": "Eso es todo lo que necesito. Haga clic en REVIEW & SIGN FORMS cuando esté listo."
+    }
+    # (Additional languages supported by PolyglotWizard in backend)
+}
+
+# Frozen per-language tables with English merged in, so t() is one lookup.
+TRANSLATIONS = MappingProxyType({
+    lang: MappingProxyType({**UI_LANG[DEFAULT_LANGUAGE], **strings})
+    for lang, strings in UI_LANG.items()
+})
+LANGUAGES = tuple(TRANSLATIONS.keys())
+
+
+def translate(language, key):
+    """Retrieves the translated string, falling back to English, then the key."""
+    return TRANSLATIONS.get(language, TRANSLATIONS[DEFAULT_LANGUAGE]).get(key, key)
+
+
+# --- 🎨 PROPRIETARY CSS STYLING ---
+FONT_CSS = {
+    "Normal": "",
+    "Large": "html, body, [class*='css'] { font-size: 20px !important; }",
+    "Extra Large": "html, body, [class*='css'] { font-size: 24px !important; }"
+}
+
+# High Contrast vs. Midnight Flux Theme logic
+HIGH_CONTRAST_CSS = """
+    .stApp { background-color: #ffffff !important; color: #000000 !important; }
+    div.block-container { background: #ffffff; border: 3px solid #000000; color: black; border-radius: 0px; }
+    .stButton>button { background: #000000 !important; color: #ffff00 !important; border: 3px solid #000000; border-radius: 0px; font-weight: 900; }
+    .stTextInput>div>div>input { background-color: #ffffff; color: black; border: 2px solid black; }
+    h1, h2, h3, h4, p, span, div, label { color: #000000 !important; font-family: Arial, sans-serif !important; }
+    """
+
+MIDNIGHT_FLUX_CSS = """
+    .stApp {
+        background: linear-gradient(-45deg, #0f2027, #203a43, #2c5364, #1f4068);
+        background-size: 400% 400%;
+        animation: gradient 15s ease infinite;
+        color: white;
+    }
+    div.block-container { background: rgba(255, 255, 255, 0.05); border-radius: 10px; padding: 20px; }
+    .stTextInput>div>div>input, .stSelectbox>div>div>div {
+        background-color: rgba(0, 0, 0, 0.3) !important; color: white !important; border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+    label, .stRadio, .stCheckbox, p, h1, h2, h3 { color: white !important; }
+    button { border: 1px solid #00d4ff !important; color: #00d4ff !important; background: transparent !important; }
+    button:hover { background: #00d4ff !important; color: black !important; }
+    """
+
+
+@lru_cache(maxsize=None)
+def theme_bundle(high_contrast, font_size):
+    """Returns the full <style> block for a (high_contrast, font_size) pair."""
+    theme_css = HIGH_CONTRAST_CSS if high_contrast else MIDNIGHT_FLUX_CSS
+    font_css = FONT_CSS.get(font_size, "")
+    return f"""
+<style>
+    {theme_css}
+    {font_css}
+
+    /* Utility Classes */
+    .link-box {{ background-color: #222; padding: 15px; border: 1px dashed #00d4ff; border-radius: 5px; font-family: monospace; color: #00d4ff; word-break: break-all; }}
+    .chat-user {{ background-color: #00d4ff; color: black; padding: 10px; border-radius: 10px; margin: 5px; text-align: right; }}
+    .chat-ai {{ background-color: #333; color: white; border: 1px solid #555; padding: 10px; border-radius: 10px; margin: 5px; text-align: left; }}
+    div[data-testid="InputInstructions"] {{ display: none !important; }}
+</style>
+"""
+
+
+# --- 💬 CHAT RENDERING ---
+# Only the most recent messages are rendered on each rerun.
+CHAT_WINDOW = 12
+
+
+def chat_html(messages):
+    """Renders a list of chat messages as a single HTML block."""
+    return "".join(
+        f"<div class='{'chat-ai' if msg['role'] == 'ai' else 'chat-user'}'>{html.escape(msg['content'])}</div>"
+        for msg in messages
+    )
@@ -0,0 +1,168 @@
+"""
+================================================================================
+  MODULE:       worker.py
+  PROJECT:      FormFluxAI
+  AUTHOR:       Justin White
+  COPYRIGHT:    (c) 2026 FormFluxAI. All Rights Reserved.
+
+  DESCRIPTION:
+  Background workers for the job queue. Run separately from the web tier:
+
+      python worker.py --processes 4
+
+  Scale the number of processes independently of Streamlit.
+================================================================================
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+import time
+import traceback
+from backend import IdentityStamper
+from dispatcher import send_secure_email, send_invite_emails, NO_EMAIL
+from sms import send_sms_alert
+from logger import log_submission
+from jobqueue import claim_job, save_checkpoint, complete_job, fail_job, LeaseLost
+
+SUBMISSIONS_DIR = "submissions"
+
+
+def run_packet_job(job):
+    """
+    Stamps every form in the packet, emails each to its recipient,
+    texts the firm and writes the submission log.
+    Each finished step is checkpointed, so retries never double-send.
+    """
+    payload = job["payload"]
+    done = job["checkpoint"]
+    client_name = payload.get("client_name", "Client")
+    out_dir = os.path.join(SUBMISSIONS_DIR, job["id"])
+    os.makedirs(out_dir, exist_ok=True)
+
+    def mark(step, value=True):
+        done[step] = value
+        save_checkpoint(job["id"], done, job["lease_token"])
+
+    # 1. STAMP + EMAIL EACH FORM
+    for form in payload["forms"]:
+        name = form["name"]
+        pdf_path = os.path.join(out_dir, re.sub(r"[^\w\-]+", "_", name) + ".pdf")
+
+        # A template that is missing or cannot be stamped is recorded per form;
+        # retrying would not fix it.
+        if f"stamp:{name}" not in done:
+            try:
+                pdf_bytes = IdentityStamper(form["filename"]).compile_final_doc(payload["form_data"], None, None, None)
+            except Exception as e:
+                traceback.print_exc()
+                mark(f"stamp:{name}", f"stamp failed: {e}")
+                continue
+            if pdf_bytes is None:
+                mark(f"stamp:{name}", "missing template")
+            else:
+                with open(pdf_path, "wb") as f:
+                    f.write(pdf_bytes)
+                mark(f"stamp:{name}")
+
+        if done[f"stamp:{name}"] is True and form.get("recipient_email") and f"email:{name}" not in done:
+            ok, info = send_secure_email(pdf_path, client_name, form["recipient_email"])
+            if not ok: raise RuntimeError(f"Email for {name} failed: {info}")
+            mark(f"email:{name}")
+
+    # 2. SMS ALERT
+    if payload.get("alert_phone") and "sms" not in done:
+        ok, info = send_sms_alert(client_name, "Full Packet", payload["alert_phone"])
+        if not ok: raise RuntimeError(f"SMS failed: {info}")
+        mark("sms")
+
+    # 3. SUBMISSION LOG
+    if "log" not in done:
+        missing = [f["name"] for f in payload["forms"] if done.get(f"stamp:{f['name']}") is not True]
+        status = "Completed" if not missing else f"Completed (not stamped: {', '.join(missing)})"
+        log_submission(client_name, "Full Packet", status, tenant_id=payload.get("tenant"))
+        mark("log")
+
+
+def run_invites_job(job):
+    """
+    Emails a batch of invite links. Each sent (or address-less) invite is
+    checkpointed as it goes, which also renews the lease on long batches,
+    so a retry only re-sends the ones that failed.
+    """
+    payload = job["payload"]
+    done = job["checkpoint"]
+    pending = [i for i in payload["invites"] if i["token"] not in done]
+    if not pending: return
+
+    failed = 0
+
+    def on_result(token, ok, info):
+        nonlocal failed
+        if ok or info == NO_EMAIL:
+            done[token] = "sent" if ok else "no email"
+            save_checkpoint(job["id"], done, job["lease_token"])
+        else:
+            failed += 1
+
+    send_invite_emails(pending, firm_name=payload.get("firm_name", "FormFlux"), on_result=on_result)
+    if failed: raise RuntimeError(f"{failed} invite email(s) not sent")
+
+
+def on_packet_failed(job, error):
+    """Out of retries: flag the packet in the firm's Client Files log for follow-up."""
+    payload = job["payload"]
+    log_submission(payload.get("client_name", "Client"), "Full Packet", "FAILED - Needs Follow-Up", tenant_id=payload.get("tenant"))
+
+
+JOB_HANDLERS = {
+    "packet": run_packet_job,
+    "invites": run_invites_job,
+}
+
+# Called once when a job runs out of attempts, so the firm hears about it.
+FAILURE_HANDLERS = {
+    "packet": on_packet_failed,
+}
+
+
+def work_forever(poll_interval=1.0):
+    """Claims and runs jobs until interrupted."""
+    while True:
+        job = claim_job()
+        if job is None:
+            time.sleep(poll_interval)
+            continue
+        try:
+            handler = JOB_HANDLERS[job["kind"]]
+            handler(job)
+            if complete_job(job["id"], job["lease_token"]):
+                print(f"[worker {os.getpid()}] {job['kind']} {job['id']} done")
+        except LeaseLost:
+            # Our lease expired and another worker took over; leave the job to it.
+            print(f"[worker {os.getpid()}] {job['kind']} {job['id']} lease lost, stopping")
+        except Exception as e:
+            traceback.print_exc()
+            if fail_job(job["id"], e, job["lease_token"]) == "failed" and job["kind"] in FAILURE_HANDLERS:
+                try: FAILURE_HANDLERS[job["kind"]](job, e)
+                except Exception: traceback.print_exc()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FormFlux background workers")
+    parser.add_argument("--processes", type=int, default=2, help="number of worker processes")
+    parser.add_argument("--poll", type=float, default=1.0, help="seconds between polls when idle")
+    args = parser.parse_args()
+
+    procs = [multiprocessing.Process(target=work_forever, args=(args.poll,), daemon=True) for _ in range(args.processes)]
+    for p in procs: p.start()
+    print(f"FormFlux workers online: {args.processes} process(es)")
+    try:
+        for p in procs: p.join()
+    except KeyboardInterrupt:
+        for p in procs: p.terminate()
+
+
+if __name__ == "__main__":
+    main()